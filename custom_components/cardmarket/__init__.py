@@ -7,6 +7,7 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 
 from .api import CardmarketScraper
 from .const import (
@@ -18,6 +19,8 @@ from .const import (
     DEFAULT_GAME,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    STORAGE_KEY_SESSION,
+    STORAGE_VERSION,
 )
 from .coordinator import CardmarketDataUpdateCoordinator
 from .services import async_setup_services, async_unload_services
@@ -33,8 +36,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
         game=entry.data.get(CONF_GAME, DEFAULT_GAME),
+        session_store=_session_store(hass, entry),
     )
 
+    # Reuse the session of the previous run to skip the login round-trips
+    await scraper.async_restore_session()
+
     # Get tracked cards from options (full card data including filters)
     tracked_cards = entry.options.get(CONF_TRACKED_CARDS, [])
 
@@ -44,13 +51,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = CardmarketDataUpdateCoordinator(
         hass, scraper, tracked_cards=tracked_cards, scan_interval=scan_interval
     )
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Setup is retried with a new scraper, release this one's session
+        # and worker threads
+        await scraper.close()
+        raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "api": scraper,
         "scraper": scraper,
         "coordinator": coordinator,
+        "entry": entry,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -65,6 +79,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _session_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store holding the session cookies of an entry."""
+    return Store(
+        hass, STORAGE_VERSION, STORAGE_KEY_SESSION.format(entry_id=entry.entry_id)
+    )
+
+
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -84,3 +105,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             await async_unload_services(hass)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored session when a config entry is removed."""
+    await _session_store(hass, entry).async_remove()
@@ -3,30 +3,130 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import re
+import sys
+import threading
 import urllib.parse
+from collections.abc import Callable, Iterator
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
 
+import aiohttp
 import cloudscraper
-from bs4 import BeautifulSoup
+import requests
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from yarl import URL
 
 from .const import (
     BASE_URL,
     DEFAULT_GAME,
-    GAME_URL_TEMPLATE,
-    LOGIN_URL_TEMPLATE,
-    MESSAGES_URL_TEMPLATE,
-    PURCHASES_URL_TEMPLATE,
-    SALES_URL_TEMPLATE,
-    SEARCH_URL_TEMPLATE,
-    STOCK_URL_TEMPLATE,
+    DEFAULT_MAX_WORKERS,
+    KEY_ACCOUNT,
+    KEY_BUYER_ORDERS_ARRIVED,
+    KEY_BUYER_ORDERS_PAID,
+    KEY_BUYER_ORDERS_SENT,
+    KEY_SELLER_ORDERS_ARRIVED,
+    KEY_SELLER_ORDERS_PAID,
+    KEY_SELLER_ORDERS_SENT,
+    KEY_STOCK_COUNT,
+    KEY_STOCK_VALUE,
+    KEY_UNREAD_MESSAGES,
+    MAX_CONCURRENT_REQUESTS,
     SUPPORTED_GAMES,
+    URL_TEMPLATES,
 )
 
+if TYPE_CHECKING:
+    from homeassistant.helpers.storage import Store
+
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Prefer the C-based lxml parser, it is considerably faster than html.parser
+try:
+    import lxml  # noqa: F401
+except ImportError:
+    _HTML_PARSER = "html.parser"
+else:
+    _HTML_PARSER = "lxml"
+
+# Marker of the Cloudflare browser challenge page
+_CHALLENGE_MARKER = b"<title>Just a moment"
+_CHALLENGE_STATUSES = (403, 503)
+
+# Field of the login form, which is only rendered for logged-out visitors
+_LOGGED_OUT_MARKER = b'name="userPassword"'
+
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+# Timeout in seconds of the blocking cloudscraper requests, so closing the
+# scraper does not wait on a stuck request forever
+_SYNC_REQUEST_TIMEOUT = _REQUEST_TIMEOUT.total
+
+# URL the cookies of the login session are bound to in the aiohttp cookie jar
+_COOKIE_URL = URL(BASE_URL)
+
+# Pre-compiled patterns used while parsing pages
+_PRICE_RE = re.compile(r"(\d+[.,]\d{2})\s*€")
+_NUMBER_RE = re.compile(r"(\d+)")
+_COUNT_RE = re.compile(r"(?:from|of|von)\s*(\d+)", re.IGNORECASE)
+_TOTAL_VALUE_RE = re.compile(r"(?:Total|Gesamt)[:\s]*(\d+[.,]\d{2})\s*€", re.IGNORECASE)
+_TEXT_SUCCESS_RE = re.compile(r"text-success", re.IGNORECASE)
+_ORDER_LINK_RE = re.compile(r"/(Paid|Sent|Arrived)(?:[/?#]|$)")
+_ANY_PRODUCT_LINK_RE = re.compile(r"/en/[^/]+/Products/Singles/")
+
+# CSS selectors, compiled once instead of on every parse
+# Badge anywhere in the parent of the envelope icon (inside the icon, before
+# or after it), and unread messages in the message list
+_MESSAGE_BADGE_SELECTOR = soupsieve.compile(":has(> [class*=envelope i]) .badge")
+_UNREAD_SELECTOR = soupsieve.compile("[class*=unread i]")
+# Price info list of a product page
+_INFO_LIST_SELECTOR = soupsieve.compile(".info-list-container")
+
+# Classes of the pagination control showing the total number of offers
+_PAGINATION_CLASSES = ("pagination-control", "mkm-table-pagination", "pagination")
+
+# Order status link path segment: (order key, link text pattern)
+_ORDER_STATUSES = {
+    "Paid": ("paid", re.compile(r"Paid\s*(\d+)", re.IGNORECASE)),
+    "Sent": ("sent", re.compile(r"Sent\s*(\d+)", re.IGNORECASE)),
+    "Arrived": ("arrived", re.compile(r"Arrived\s*(\d+)", re.IGNORECASE)),
+}
+
+# Product page info list labels mapped to price fields, checked in order.
+# "available" must come before "ab", which it contains.
+_LABEL_MAP = (
+    ("available", "available_items"),
+    ("verfügbar", "available_items"),
+    ("from", "price_from"),
+    ("ab", "price_from"),
+    ("trend", "price_trend"),
+    ("30-day", "price_30_day_avg"),
+    ("30 day", "price_30_day_avg"),
+    ("7-day", "price_7_day_avg"),
+    ("7 day", "price_7_day_avg"),
+    ("1-day", "price_1_day_avg"),
+    ("1 day", "price_1_day_avg"),
+    ("printed", "set"),
+    ("gedruckt", "set"),
+)
+
+
+def _is_product_row_id(value: str | None) -> bool:
+    """Return whether an element id is that of a search result row."""
+    return value is not None and value.startswith("productRow") and value[10:].isdigit()
+
+
+# Strainers limiting the parsed tree to the elements a parser looks at
+_BALANCE_STRAINER = SoupStrainer(id="totalCreditMainNav")
+_BALANCE_FALLBACK_STRAINER = SoupStrainer(class_=_TEXT_SUCCESS_RE)
+_ORDER_LINK_STRAINER = SoupStrainer("a", href=_ORDER_LINK_RE)
+_PRODUCT_ROW_STRAINER = SoupStrainer("div", id=_is_product_row_id)
+
 
 class CardmarketError(Exception):
     """Base exception for Cardmarket errors."""
@@ -45,6 +145,10 @@ class CardmarketConnectionError(CardmarketError):
     """Exception for connection errors."""
 
 
+class _SessionExpiredError(CardmarketAuthError):
+    """Exception raised when a page shows we are no longer logged in."""
+
+
 class CardmarketScraper:
     """Cardmarket Web Scraper client using cloudscraper to bypass Cloudflare."""
 
@@ -53,14 +157,36 @@ class CardmarketScraper:
         username: str,
         password: str,
         game: str = DEFAULT_GAME,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        session_store: Store | None = None,
     ) -> None:
         """Initialize the scraper client."""
         self._username = username
         self._password = password
         self._game = game if game in SUPPORTED_GAMES else DEFAULT_GAME
+        # The game is fixed per scraper, so its URLs are formatted only once
+        self.urls = {
+            name: template.format(game=self._game)
+            for name, template in URL_TEMPLATES.items()
+        }
+        self._product_link_re = re.compile(rf"/en/{self._game}/Products/Singles/")
+        self._product_page_re = re.compile(
+            rf"/en/{self._game}/Products/Singles/[^/]+/[^/]+$"
+        )
         self._scraper: cloudscraper.CloudScraper | None = None
+        self._thread_scrapers: dict[int, cloudscraper.CloudScraper] = {}
+        self._thread_lock = threading.Lock()
         self._logged_in = False
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._login_lock = asyncio.Lock()
+        self._session_store = session_store
+        self._session: aiohttp.ClientSession | None = None
+        self._use_session = True
+        self._tick_cache: dict[str, asyncio.Future[bytes]] | None = None
+        self._parse_cache: dict[str, tuple[bytes, Any]] = {}
+        # Bounds the requests in flight to stay below Cardmarket's rate limits
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
 
     @property
     def game(self) -> str:
@@ -72,29 +198,103 @@ class CardmarketScraper:
         """Return the display name of the current game."""
         return SUPPORTED_GAMES.get(self._game, self._game)
 
-    def _get_url(self, template: str) -> str:
-        """Get a URL with the game substituted."""
-        return template.format(game=self._game)
+    @staticmethod
+    def _create_scraper() -> cloudscraper.CloudScraper:
+        """Create a new cloudscraper session."""
+        return cloudscraper.create_scraper(
+            browser={
+                'browser': 'chrome',
+                'platform': 'windows',
+                'desktop': True
+            }
+        )
 
     def _get_scraper(self) -> cloudscraper.CloudScraper:
-        """Get or create cloudscraper session."""
+        """Get or create the cloudscraper session used for logging in."""
         if self._scraper is None:
-            self._scraper = cloudscraper.create_scraper(
-                browser={
-                    'browser': 'chrome',
-                    'platform': 'windows',
-                    'desktop': True
-                }
-            )
+            self._scraper = self._create_scraper()
         return self._scraper
 
+    def _get_thread_scraper(self) -> cloudscraper.CloudScraper:
+        """Get or create the cloudscraper session of the current worker thread.
+
+        Sessions are not safe for concurrent use, so every executor thread gets
+        its own session seeded with the cookies of the logged-in session.
+        """
+        thread_id = threading.get_ident()
+        scraper = self._thread_scrapers.get(thread_id)
+        if scraper is None:
+            scraper = self._create_scraper()
+            scraper.cookies.update(self._get_scraper().cookies)
+            with self._thread_lock:
+                self._thread_scrapers[thread_id] = scraper
+        return scraper
+
+    def _share_cookies(self) -> None:
+        """Copy the cookies of the logged-in session to the worker sessions."""
+        cookies = self._get_scraper().cookies
+        with self._thread_lock:
+            for scraper in self._thread_scrapers.values():
+                scraper.cookies.update(cookies)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session sharing the login cookies."""
+        if self._session is None or self._session.closed:
+            scraper = self._get_scraper()
+            self._session = aiohttp.ClientSession(
+                headers={"User-Agent": scraper.headers["User-Agent"]},
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=60),
+                timeout=_REQUEST_TIMEOUT,
+            )
+            self._set_session_cookies(scraper.cookies.get_dict())
+        return self._session
+
+    def _set_session_cookies(self, cookies: dict[str, str]) -> None:
+        """Replace the cookies of the aiohttp session with those of a login.
+
+        The cookies are bound to the Cardmarket domain. Cookies without a
+        domain would lose against the domain-bound cookies aiohttp receives
+        from Cardmarket later, like the session ID of a logged-out page.
+        """
+        cookie_jar = self._session.cookie_jar
+        cookie_jar.clear()
+        cookie_jar.update_cookies(cookies, response_url=_COOKIE_URL)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the executor running the blocking cloudscraper calls."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="cardmarket"
+            )
+        return self._executor
+
     async def close(self) -> None:
-        """Close the session."""
+        """Close the session and release the worker threads.
+
+        The scraper can be used again afterwards, everything is recreated on
+        the next request.
+        """
+        self._tick_cache = None
+        self._parse_cache.clear()
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            # Let running requests finish without blocking the event loop
+            await asyncio.get_event_loop().run_in_executor(
+                None, partial(executor.shutdown, wait=True, cancel_futures=True)
+            )
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        with self._thread_lock:
+            thread_scrapers = list(self._thread_scrapers.values())
+            self._thread_scrapers.clear()
+        for scraper in thread_scrapers:
+            scraper.close()
         if self._scraper:
             self._scraper.close()
             self._scraper = None
-            self._logged_in = False
-        self._executor.shutdown(wait=False)
+        self._logged_in = False
+        self._use_session = True
 
     def _sync_login(self) -> bool:
         """Synchronous login to Cardmarket."""
@@ -102,15 +302,15 @@ class CardmarketScraper:
 
         try:
             # First, get the login page to obtain CSRF token
-            game_url = self._get_url(GAME_URL_TEMPLATE)
-            response = scraper.get(game_url)
+            game_url = self.urls["game"]
+            response = scraper.get(game_url, timeout=_SYNC_REQUEST_TIMEOUT)
             if response.status_code != 200:
                 raise CardmarketConnectionError(
                     f"Failed to load Cardmarket page: {response.status_code}"
                 )
 
             # Parse the page for CSRF token
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, _HTML_PARSER)
             csrf_input = soup.find("input", {"name": "__cmtkn"})
             csrf_token = csrf_input.get("value") if csrf_input else None
 
@@ -124,8 +324,10 @@ class CardmarketScraper:
             if csrf_token:
                 login_data["__cmtkn"] = csrf_token
 
-            login_url = self._get_url(LOGIN_URL_TEMPLATE)
-            response = scraper.post(login_url, data=login_data)
+            login_url = self.urls["login"]
+            response = scraper.post(
+                login_url, data=login_data, timeout=_SYNC_REQUEST_TIMEOUT
+            )
 
             if response.status_code != 200:
                 raise CardmarketAuthError(
@@ -134,6 +336,7 @@ class CardmarketScraper:
 
             # Check if login was successful
             if self._username.lower() in response.text.lower():
+                self._share_cookies()
                 self._logged_in = True
                 _LOGGER.debug("Successfully logged in to Cardmarket")
                 return True
@@ -150,148 +353,206 @@ class CardmarketScraper:
     async def login(self) -> bool:
         """Log in to Cardmarket (async wrapper)."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, self._sync_login)
+        logged_in = await loop.run_in_executor(self._get_executor(), self._sync_login)
+        if logged_in:
+            cookies = self._get_scraper().cookies.get_dict()
+            if self._session is not None and not self._session.closed:
+                self._set_session_cookies(cookies)
+            # Store the refreshed cookies, the previous ones are no longer valid
+            if self._session_store is not None:
+                await self._session_store.async_save(cookies)
+        return logged_in
+
+    def _restore_cookies(self, cookies: dict[str, str]) -> None:
+        """Load cookies of a previous session into the login session."""
+        self._get_scraper().cookies.update(cookies)
+        self._share_cookies()
+
+    async def async_restore_session(self) -> None:
+        """Restore the cookies of a previous session from the session store.
+
+        The restored session is assumed to still be valid. If Cardmarket
+        redirects to the login page, we log in again on the next request.
+        """
+        if self._session_store is None:
+            return
+        cookies = await self._session_store.async_load()
+        if not cookies:
+            return
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self._get_executor(), self._restore_cookies, cookies)
+        self._logged_in = True
+        _LOGGER.debug("Restored Cardmarket session from storage")
 
     async def _ensure_logged_in(self) -> None:
-        """Ensure we are logged in."""
-        if not self._logged_in:
-            await self.login()
+        """Ensure we are logged in, logging in only once for concurrent callers."""
+        if self._logged_in:
+            return
+        async with self._login_lock:
+            if not self._logged_in:
+                await self.login()
+
+    def _check_session(self, status: int, url: str, html: bytes) -> None:
+        """Raise if a response shows that our session is no longer logged in.
+
+        An expired session is not always an error response, Cardmarket may
+        also redirect to the login page or render a page with the login form.
+        """
+        if status == 401 or "/Login" in url or _LOGGED_OUT_MARKER in html:
+            self._logged_in = False
+            raise _SessionExpiredError("Cardmarket session expired")
 
-    def _sync_get_page(self, url: str) -> str:
-        """Synchronously get a page."""
-        scraper = self._get_scraper()
-        response = scraper.get(url)
+    def _sync_get_page(self, url: str) -> bytes:
+        """Synchronously get the raw content of a page.
+
+        The undecoded bytes are passed on to the parser, which reads the
+        charset from the page instead of requests guessing the encoding.
+        """
+        scraper = self._get_thread_scraper()
+        try:
+            response = scraper.get(url, timeout=_SYNC_REQUEST_TIMEOUT)
+        except cloudscraper.exceptions.CloudflareChallengeError as err:
+            raise CardmarketConnectionError(f"Cloudflare challenge failed: {err}") from err
+        except requests.RequestException as err:
+            raise CardmarketConnectionError(f"Connection error: {err}") from err
+        self._check_session(response.status_code, response.url, response.content)
         if response.status_code != 200:
             raise CardmarketConnectionError(f"Failed to load page: {response.status_code}")
-        return response.text
+        return response.content
 
-    async def _get_page(self, url: str) -> str:
-        """Get a page asynchronously."""
+    async def _async_get_page(self, url: str) -> bytes | None:
+        """Get a page with aiohttp, returning None if Cloudflare challenges us."""
+        try:
+            async with self._get_session().get(url) as response:
+                html = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            raise CardmarketConnectionError(f"Connection error: {err}") from err
+
+        if response.status in _CHALLENGE_STATUSES or _CHALLENGE_MARKER in html:
+            # Only cloudscraper can solve challenges, use it from now on
+            _LOGGER.debug("Cloudflare challenge received, falling back to cloudscraper")
+            self._use_session = False
+            return None
+        self._check_session(response.status, str(response.url), html)
+        if response.status != 200:
+            raise CardmarketConnectionError(f"Failed to load page: {response.status}")
+        return html
+
+    async def _get_page(self, url: str) -> bytes:
+        """Get a page, sharing the request while an update is in progress."""
+        if self._tick_cache is None:
+            return await self._fetch_page(url)
+        if (task := self._tick_cache.get(url)) is None:
+            task = self._tick_cache[url] = asyncio.ensure_future(self._fetch_page(url))
+        return await task
+
+    async def _fetch_page(self, url: str, retry: bool = True) -> bytes:
+        """Fetch a page asynchronously, logging in again once if the session expired.
+
+        Once logged in, pages are requested with aiohttp directly on the event
+        loop. cloudscraper in the executor is only used before the login and
+        when Cloudflare challenges the aiohttp session.
+        """
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, self._sync_get_page, url)
+        try:
+            async with self._request_semaphore:
+                if self._use_session and self._logged_in:
+                    html = await self._async_get_page(url)
+                    if html is not None:
+                        return html
+                return await loop.run_in_executor(
+                    self._get_executor(), self._sync_get_page, url
+                )
+        except _SessionExpiredError:
+            if not retry:
+                raise
+            _LOGGER.debug("Cardmarket session expired, logging in again")
+            await self._ensure_logged_in()
+            return await self._fetch_page(url, retry=False)
+
+    def _parse_cached(self, key: str, html: bytes, parse: Callable[[bytes], _T]) -> _T:
+        """Parse a page, reusing the previous result if the page is unchanged.
 
-    def _parse_balance_from_html(self, html: str) -> float:
+        The result of the last parse is kept per key together with a digest
+        of the page it was parsed from. Results are shared between calls, so
+        they must not be modified by the caller.
+        """
+        digest = hashlib.blake2b(html, digest_size=16).digest()
+        if (cached := self._parse_cache.get(key)) is not None and cached[0] == digest:
+            return cached[1]
+        result = parse(html)
+        self._parse_cache[key] = (digest, result)
+        return result
+
+    def _parse_balance_from_html(self, html: bytes) -> float:
         """Parse account balance from HTML."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_BALANCE_STRAINER)
 
         # Look for the balance in the header navigation
         # Pattern: <span id="totalCreditMainNav">(&nbsp;15,43 €&nbsp;)</span>
         balance_elem = soup.find(id="totalCreditMainNav")
         if balance_elem:
             balance_text = balance_elem.get_text()
-            balance_match = re.search(r"(\d+[.,]\d{2})\s*€", balance_text)
+            balance_match = _PRICE_RE.search(balance_text)
             if balance_match:
                 return float(balance_match.group(1).replace(",", "."))
 
         # Alternative: Look for any element with balance-like text
-        for elem in soup.find_all(class_=re.compile(r"text-success", re.IGNORECASE)):
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_BALANCE_FALLBACK_STRAINER)
+        for elem in soup.find_all(class_=_TEXT_SUCCESS_RE):
             text = elem.get_text()
-            balance_match = re.search(r"(\d+[.,]\d{2})\s*€", text)
+            balance_match = _PRICE_RE.search(text)
             if balance_match:
                 return float(balance_match.group(1).replace(",", "."))
 
         return 0.0
 
-    def _parse_order_counts_from_html(self, html: str) -> dict[str, int]:
+    def _parse_order_counts_from_html(self, html: bytes) -> dict[str, int]:
         """Parse order counts from HTML."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_ORDER_LINK_STRAINER)
         orders = {"paid": 0, "sent": 0, "arrived": 0}
 
         # Look for links with order status and count
         # Pattern: <a href="/en/Magic/Orders/Sales/Paid">Paid0</a>
-        for link in soup.find_all("a"):
-            href = link.get("href", "")
-            text = link.get_text().strip()
-
-            if "/Paid" in href:
-                # Extract number from text like "Paid0" or "Paid 0"
-                match = re.search(r"Paid\s*(\d+)", text, re.IGNORECASE)
-                if match:
-                    orders["paid"] = int(match.group(1))
-                else:
-                    # Look for badge inside the link
-                    badge = link.find(class_="badge")
-                    if badge:
-                        try:
-                            orders["paid"] = int(badge.get_text().strip())
-                        except ValueError:
-                            pass
-
-            elif "/Sent" in href:
-                match = re.search(r"Sent\s*(\d+)", text, re.IGNORECASE)
-                if match:
-                    orders["sent"] = int(match.group(1))
-                else:
-                    badge = link.find(class_="badge")
-                    if badge:
-                        try:
-                            orders["sent"] = int(badge.get_text().strip())
-                        except ValueError:
-                            pass
-
-            elif "/Arrived" in href:
-                match = re.search(r"Arrived\s*(\d+)", text, re.IGNORECASE)
-                if match:
-                    orders["arrived"] = int(match.group(1))
-                else:
-                    badge = link.find(class_="badge")
-                    if badge:
-                        try:
-                            orders["arrived"] = int(badge.get_text().strip())
-                        except ValueError:
-                            pass
+        for link in soup.find_all("a", href=_ORDER_LINK_RE):
+            status, count_re = _ORDER_STATUSES[
+                _ORDER_LINK_RE.search(link["href"]).group(1)
+            ]
+
+            # Extract number from text like "Paid0" or "Paid 0"
+            match = count_re.search(link.get_text().strip())
+            if match:
+                orders[status] = int(match.group(1))
+                continue
+
+            # Look for badge inside the link
+            badge = link.find(class_="badge")
+            if badge:
+                try:
+                    orders[status] = int(badge.get_text().strip())
+                except ValueError:
+                    pass
 
         return orders
 
-    def _parse_message_count_from_html(self, html: str) -> int:
+    def _parse_message_count_from_html(self, html: bytes) -> int:
         """Parse unread message count from HTML."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, _HTML_PARSER)
 
         # Look for unread badge in message section
         # Check for envelope icon with badge
-        envelope_elem = soup.find(class_=re.compile(r"envelope", re.IGNORECASE))
-        if envelope_elem:
-            parent = envelope_elem.find_parent()
-            if parent:
-                badge = parent.find(class_="badge")
-                if badge:
-                    try:
-                        return int(badge.get_text().strip())
-                    except ValueError:
-                        pass
+        badge = _MESSAGE_BADGE_SELECTOR.select_one(soup)
+        if badge:
+            badge_text = badge.get_text(strip=True)
+            if badge_text.isdigit():
+                return int(badge_text)
 
         # Look for unread class
-        unread_rows = soup.find_all(class_=re.compile(r"unread", re.IGNORECASE))
-        if unread_rows:
-            return len(unread_rows)
-
-        return 0
+        return len(_UNREAD_SELECTOR.select(soup))
 
-    async def get_account_data(self) -> dict[str, Any]:
-        """Get account information from the website."""
-        await self._ensure_logged_in()
-
-        # Get any page to extract the balance from header
-        stock_url = self._get_url(STOCK_URL_TEMPLATE)
-        html = await self._get_page(stock_url)
-
-        balance = self._parse_balance_from_html(html)
-
-        return {
-            "username": self._username,
-            "game": self._game,
-            "game_name": self.game_name,
-            "balance": balance,
-        }
-
-    async def get_stock_data(self) -> dict[str, Any]:
-        """Get stock information from the website."""
-        await self._ensure_logged_in()
-
-        stock_url = self._get_url(STOCK_URL_TEMPLATE) + "/Offers"
-        html = await self._get_page(stock_url)
-
-        soup = BeautifulSoup(html, "html.parser")
+    def _parse_stock_data_from_html(self, html: bytes) -> dict[str, Any]:
+        """Parse stock count and value from the stock offers page."""
+        soup = BeautifulSoup(html, _HTML_PARSER)
 
         stock_data: dict[str, Any] = {
             "stock_count": 0,
@@ -299,11 +560,24 @@ class CardmarketScraper:
         }
 
         # Look for pagination info which often shows total count
-        # Or count table rows
-        page_text = soup.get_text()
-
         # Pattern: "1 to 25 from 156" or similar
-        count_match = re.search(r"(?:from|of|von)\s*(\d+)", page_text, re.IGNORECASE)
+        pagination = soup.find(class_=_PAGINATION_CLASSES)
+        count_match = (
+            _COUNT_RE.search(pagination.get_text(" ", strip=True)) if pagination else None
+        )
+
+        # The total value is shown below the offers table
+        summary = soup.find("tfoot") or soup.find(class_="summary")
+        value_match = (
+            _TOTAL_VALUE_RE.search(summary.get_text(" ", strip=True)) if summary else None
+        )
+
+        # Fall back to searching the text of the whole page
+        if count_match is None or value_match is None:
+            page_text = soup.get_text()
+            count_match = count_match or _COUNT_RE.search(page_text)
+            value_match = value_match or _TOTAL_VALUE_RE.search(page_text)
+
         if count_match:
             stock_data["stock_count"] = int(count_match.group(1))
 
@@ -314,36 +588,65 @@ class CardmarketScraper:
             if rows:
                 stock_data["stock_count"] = max(stock_data["stock_count"], len(rows) - 1)
 
-        # Try to find total value
-        value_match = re.search(r"(?:Total|Gesamt)[:\s]*(\d+[.,]\d{2})\s*€", page_text, re.IGNORECASE)
         if value_match:
             stock_data["stock_value"] = float(value_match.group(1).replace(",", "."))
 
         return stock_data
 
+    async def get_account_data(self) -> dict[str, Any]:
+        """Get account information from the website."""
+        await self._ensure_logged_in()
+
+        # The balance is shown in the header of every page, use the stock
+        # offers page, which get_stock_data needs anyway
+        stock_url = self.urls["stock"] + "/Offers"
+        html = await self._get_page(stock_url)
+
+        balance = self._parse_cached("balance", html, self._parse_balance_from_html)
+
+        return {
+            "username": self._username,
+            "game": self._game,
+            "game_name": self.game_name,
+            "balance": balance,
+        }
+
+    async def get_stock_data(self) -> dict[str, Any]:
+        """Get stock information from the website."""
+        await self._ensure_logged_in()
+
+        stock_url = self.urls["stock"] + "/Offers"
+        html = await self._get_page(stock_url)
+
+        return self._parse_cached("stock", html, self._parse_stock_data_from_html)
+
     async def get_seller_orders(self) -> dict[str, int]:
         """Get seller order counts from the website."""
         await self._ensure_logged_in()
 
-        sales_url = self._get_url(SALES_URL_TEMPLATE)
+        sales_url = self.urls["sales"]
         html = await self._get_page(sales_url)
-        return self._parse_order_counts_from_html(html)
+        return self._parse_cached("sales", html, self._parse_order_counts_from_html)
 
     async def get_buyer_orders(self) -> dict[str, int]:
         """Get buyer order counts from the website."""
         await self._ensure_logged_in()
 
-        purchases_url = self._get_url(PURCHASES_URL_TEMPLATE)
+        purchases_url = self.urls["purchases"]
         html = await self._get_page(purchases_url)
-        return self._parse_order_counts_from_html(html)
+        return self._parse_cached(
+            "purchases", html, self._parse_order_counts_from_html
+        )
 
     async def get_unread_messages(self) -> int:
         """Get unread message count from the website."""
         await self._ensure_logged_in()
 
-        messages_url = self._get_url(MESSAGES_URL_TEMPLATE)
+        messages_url = self.urls["messages"]
         html = await self._get_page(messages_url)
-        return self._parse_message_count_from_html(html)
+        return self._parse_cached(
+            "messages", html, self._parse_message_count_from_html
+        )
 
     async def test_connection(self) -> bool:
         """Test if we can connect and log in."""
@@ -357,23 +660,47 @@ class CardmarketScraper:
         """Get all available data from the website."""
         await self._ensure_logged_in()
 
-        account_data = await self.get_account_data()
-        stock_data = await self.get_stock_data()
-        seller_orders = await self.get_seller_orders()
-        buyer_orders = await self.get_buyer_orders()
-        unread_messages = await self.get_unread_messages()
+        # The pages are independent, so fetch them concurrently. Pages are
+        # shared for the duration of the update, so the stock offers page
+        # used for both the balance and the stock data is fetched only once.
+        self._tick_cache = {}
+        try:
+            results = await asyncio.gather(
+                self.get_account_data(),
+                self.get_stock_data(),
+                self.get_seller_orders(),
+                self.get_buyer_orders(),
+                self.get_unread_messages(),
+                return_exceptions=True,
+            )
+        finally:
+            self._tick_cache = None
+
+        # A failed page must not be published as zero balance, stock or orders,
+        # so the whole update fails if any of the pages failed
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            for err in errors[1:]:
+                _LOGGER.debug("Failed to fetch part of the Cardmarket data: %s", err)
+            if isinstance(errors[0], CardmarketError):
+                raise errors[0]
+            raise CardmarketError(
+                f"Failed to fetch Cardmarket data: {errors[0]}"
+            ) from errors[0]
+
+        account_data, stock_data, seller_orders, buyer_orders, unread_messages = results
 
         return {
-            "account": account_data,
-            "stock_count": stock_data.get("stock_count", 0),
-            "stock_value": stock_data.get("stock_value", 0.0),
-            "seller_orders_paid": seller_orders.get("paid", 0),
-            "seller_orders_sent": seller_orders.get("sent", 0),
-            "seller_orders_arrived": seller_orders.get("arrived", 0),
-            "buyer_orders_paid": buyer_orders.get("paid", 0),
-            "buyer_orders_sent": buyer_orders.get("sent", 0),
-            "buyer_orders_arrived": buyer_orders.get("arrived", 0),
-            "unread_messages": unread_messages,
+            KEY_ACCOUNT: account_data,
+            KEY_STOCK_COUNT: stock_data.get("stock_count", 0),
+            KEY_STOCK_VALUE: stock_data.get("stock_value", 0.0),
+            KEY_SELLER_ORDERS_PAID: seller_orders.get("paid", 0),
+            KEY_SELLER_ORDERS_SENT: seller_orders.get("sent", 0),
+            KEY_SELLER_ORDERS_ARRIVED: seller_orders.get("arrived", 0),
+            KEY_BUYER_ORDERS_PAID: buyer_orders.get("paid", 0),
+            KEY_BUYER_ORDERS_SENT: buyer_orders.get("sent", 0),
+            KEY_BUYER_ORDERS_ARRIVED: buyer_orders.get("arrived", 0),
+            KEY_UNREAD_MESSAGES: unread_messages,
         }
 
     async def search_cards(self, search_term: str, max_results: int = 10) -> list[dict[str, Any]]:
@@ -387,16 +714,16 @@ class CardmarketScraper:
             List of card dictionaries with name, set, url, and price info
         """
         encoded_search = urllib.parse.quote(search_term)
-        search_url = self._get_url(SEARCH_URL_TEMPLATE)
+        search_url = self.urls["search"]
         url = f"{search_url}?searchString={encoded_search}"
         
         html = await self._get_page(url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_PRODUCT_ROW_STRAINER)
         
         results = []
         
         # Find all product rows
-        product_rows = soup.find_all("div", id=re.compile(r"productRow\d+"))
+        product_rows = soup.find_all("div", id=_is_product_row_id)
         
         for row in product_rows[:max_results]:
             card_info = self._parse_search_result_row(row)
@@ -406,7 +733,12 @@ class CardmarketScraper:
         # If no product rows found, try finding product links directly
         if not results:
             # Match any game's product links
-            product_links = soup.find_all("a", href=re.compile(rf"/en/{self._game}/Products/Singles/[^/]+/[^/]+$"))
+            soup = BeautifulSoup(
+                html,
+                _HTML_PARSER,
+                parse_only=SoupStrainer("a", href=self._product_page_re),
+            )
+            product_links = soup.find_all("a", href=self._product_page_re)
             seen_urls = set()
             
             for link in product_links:
@@ -433,10 +765,10 @@ class CardmarketScraper:
     def _parse_search_result_row(self, row) -> dict[str, Any] | None:
         """Parse a search result row into card info."""
         # Find the product link - match any game's product links
-        link = row.find("a", href=re.compile(rf"/en/{self._game}/Products/Singles/"))
+        link = row.find("a", href=self._product_link_re)
         if not link:
             # Try generic pattern as fallback
-            link = row.find("a", href=re.compile(r"/en/[^/]+/Products/Singles/"))
+            link = row.find("a", href=_ANY_PRODUCT_LINK_RE)
         if not link:
             return None
         
@@ -452,7 +784,7 @@ class CardmarketScraper:
         price_elem = row.find(class_="price-container")
         if price_elem:
             price_text = price_elem.get_text(strip=True)
-            price_match = re.search(r"(\d+[.,]\d{2})\s*€", price_text)
+            price_match = _PRICE_RE.search(price_text)
             if price_match:
                 price = float(price_match.group(1).replace(",", "."))
         
@@ -464,6 +796,17 @@ class CardmarketScraper:
             "price_from": price,
         }
 
+    @staticmethod
+    def _iter_label_value_pairs(soup: BeautifulSoup) -> Iterator[tuple[str, str]]:
+        """Yield the lowercased labels and values of the product info list.
+
+        Falls back to the definition lists of the whole page if the info list
+        container is not found.
+        """
+        container = _INFO_LIST_SELECTOR.select_one(soup) or soup
+        for dt, dd in zip(container.find_all("dt"), container.find_all("dd")):
+            yield dt.get_text(strip=True).lower(), dd.get_text(strip=True)
+
     async def get_card_prices(
         self, 
         card_url: str,
@@ -504,7 +847,7 @@ class CardmarketScraper:
             filter_url = f"{card_url}{separator}{'&'.join(filter_params)}"
         
         html = await self._get_page(filter_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, _HTML_PARSER)
         
         prices: dict[str, Any] = {
             "name": "",
@@ -526,71 +869,24 @@ class CardmarketScraper:
             # Title format is usually "Card NameSet Name - Singles"
             prices["name"] = title_text.split(" - ")[0] if " - " in title_text else title_text
         
-        # Find the info list container with price data
-        info_list = soup.find(class_="info-list-container")
-        if info_list:
-            # Get all dt (labels) and dd (values) pairs
-            dts = info_list.find_all("dt")
-            dds = info_list.find_all("dd")
-            
-            for i, dt in enumerate(dts):
-                if i >= len(dds):
+        for label, value_text in self._iter_label_value_pairs(soup):
+            for needle, field in _LABEL_MAP:
+                if needle in label:
                     break
-                    
-                label = dt.get_text(strip=True).lower()
-                value_elem = dds[i]
-                value_text = value_elem.get_text(strip=True)
-                
-                # Parse different price types
-                if "from" in label or "ab" in label:
-                    price_match = re.search(r"(\d+[.,]\d{2})\s*€", value_text)
-                    if price_match:
-                        prices["price_from"] = float(price_match.group(1).replace(",", "."))
-                
-                elif "trend" in label:
-                    price_match = re.search(r"(\d+[.,]\d{2})\s*€", value_text)
-                    if price_match:
-                        prices["price_trend"] = float(price_match.group(1).replace(",", "."))
-                
-                elif "30-day" in label or "30 day" in label:
-                    price_match = re.search(r"(\d+[.,]\d{2})\s*€", value_text)
-                    if price_match:
-                        prices["price_30_day_avg"] = float(price_match.group(1).replace(",", "."))
-                
-                elif "7-day" in label or "7 day" in label:
-                    price_match = re.search(r"(\d+[.,]\d{2})\s*€", value_text)
-                    if price_match:
-                        prices["price_7_day_avg"] = float(price_match.group(1).replace(",", "."))
-                
-                elif "1-day" in label or "1 day" in label:
-                    price_match = re.search(r"(\d+[.,]\d{2})\s*€", value_text)
-                    if price_match:
-                        prices["price_1_day_avg"] = float(price_match.group(1).replace(",", "."))
-                
-                elif "available" in label or "verfügbar" in label:
-                    count_match = re.search(r"(\d+)", value_text)
-                    if count_match:
-                        prices["available_items"] = int(count_match.group(1))
-                
-                elif "printed" in label or "gedruckt" in label:
-                    prices["set"] = value_text
-        
-        # Alternative: Parse from definition lists if info-list not found
-        if prices["price_from"] is None:
-            dds = soup.find_all("dd")
-            for i, dd in enumerate(dds):
-                text = dd.get_text(strip=True)
-                if '€' in text:
-                    price_match = re.search(r"(\d+[.,]\d{2})\s*€", text)
-                    if price_match:
-                        price = float(price_match.group(1).replace(",", "."))
-                        if prices["price_from"] is None:
-                            prices["price_from"] = price
-                        elif prices["price_trend"] is None:
-                            prices["price_trend"] = price
-                        elif prices["price_30_day_avg"] is None:
-                            prices["price_30_day_avg"] = price
-        
+            else:
+                continue
+
+            if field == "set":
+                prices["set"] = value_text
+            elif field == "available_items":
+                count_match = _NUMBER_RE.search(value_text)
+                if count_match:
+                    prices["available_items"] = int(count_match.group(1))
+            else:
+                price_match = _PRICE_RE.search(value_text)
+                if price_match:
+                    prices[field] = float(price_match.group(1).replace(",", "."))
+
         return prices
 
     async def get_tracked_card_prices(
@@ -606,29 +902,47 @@ class CardmarketScraper:
             Dictionary mapping card unique keys to their price data
         """
         await self._ensure_logged_in()
-        
-        results = {}
+
+        # Cards sharing URL and filters only differ in their key, fetch them once
+        pending: dict[tuple[str, str, str, str], list[str]] = {}
         for card in tracked_cards:
             url = card.get("url", "")
-            unique_key = card.get("unique_key", url)
-            language = card.get("language", "")
-            condition = card.get("condition", "")
-            foil = card.get("foil", "")
-            
-            try:
-                prices = await self.get_card_prices(
-                    url, 
-                    language=language,
-                    condition=condition,
-                    foil=foil,
+            request = (
+                url,
+                card.get("language", ""),
+                card.get("condition", ""),
+                card.get("foil", ""),
+            )
+            # Interned like the keys of the card sensors looking up the results
+            pending.setdefault(request, []).append(
+                sys.intern(card.get("unique_key") or url)
+            )
+
+        # Concurrency is bounded by the request semaphore of the scraper
+        fetched = await asyncio.gather(
+            *(
+                self.get_card_prices(
+                    url, language=language, condition=condition, foil=foil
                 )
+                for url, language, condition, foil in pending
+            ),
+            return_exceptions=True,
+        )
+
+        results: dict[str, dict[str, Any]] = {}
+        for (request, unique_keys), prices in zip(pending.items(), fetched):
+            _, language, condition, foil = request
+            for unique_key in unique_keys:
+                if isinstance(prices, BaseException):
+                    _LOGGER.warning("Failed to get prices for %s: %s", unique_key, prices)
+                    results[unique_key] = {"error": str(prices)}
+                    continue
                 # Add filter info to the result
-                prices["language"] = language
-                prices["condition"] = condition
-                prices["foil"] = foil
-                results[unique_key] = prices
-            except Exception as err:
-                _LOGGER.warning("Failed to get prices for %s: %s", unique_key, err)
-                results[unique_key] = {"error": str(err)}
-        
+                results[unique_key] = {
+                    **prices,
+                    "language": language,
+                    "condition": condition,
+                    "foil": foil,
+                }
+
         return results
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import sys
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -34,15 +36,46 @@ from .const import (
     CARD_LANGUAGES,
     CONF_TRACKED_CARDS,
     DOMAIN,
+    KEY_TRACKED_CARDS,
 )
 from .coordinator import CardmarketDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Characters of the card key that are replaced to build the unique ID
+_SAFE_ID_TABLE = str.maketrans(
+    {"/": "_", ":": None, ".": "_", "?": "_", "&": "_", "=": "_"}
+)
+
+# Fields of the price data exposed as attributes, empty values are skipped
+_PRICE_FIELDS = (
+    ("price_from", ATTR_PRICE_FROM),
+    ("price_trend", ATTR_PRICE_TREND),
+    ("price_30_day_avg", ATTR_PRICE_30_DAY),
+    ("price_7_day_avg", ATTR_PRICE_7_DAY),
+    ("price_1_day_avg", ATTR_PRICE_1_DAY),
+    ("available_items", ATTR_AVAILABLE_ITEMS),
+)
+
 
 class CardmarketCardPriceSensor(CoordinatorEntity, SensorEntity):
     """Sensor for tracking a single card's price."""
 
+    # The entity base classes keep their __dict__, the slots only cover the
+    # attributes of this sensor
+    __slots__ = (
+        "_card_url",
+        "_card_name",
+        "_card_set",
+        "_entry",
+        "_language",
+        "_condition",
+        "_foil",
+        "_unique_key",
+        "_card_data",
+        "_static_attrs",
+    )
+
     _attr_has_entity_name = True
     _attr_native_unit_of_measurement = "€"
     _attr_device_class = SensorDeviceClass.MONETARY
@@ -59,8 +92,14 @@ class CardmarketCardPriceSensor(CoordinatorEntity, SensorEntity):
         condition: str = "",
         foil: str = "",
         unique_key: str = "",
+        display_name: str = "",
+        safe_id: str = "",
     ) -> None:
-        """Initialize the card price sensor."""
+        """Initialize the card price sensor.
+
+        The display name and the sanitized ID are built beforehand by
+        _format_name.
+        """
         super().__init__(coordinator)
         
         self._card_url = card_url
@@ -72,88 +111,63 @@ class CardmarketCardPriceSensor(CoordinatorEntity, SensorEntity):
         self._foil = foil
         self._unique_key = unique_key or card_url
         
-        # Create a unique ID based on the unique key
-        safe_id = self._unique_key.replace("/", "_").replace(":", "").replace(".", "_").replace("?", "_").replace("&", "_").replace("=", "_")
         self._attr_unique_id = f"{entry.entry_id}_card_{safe_id}"
+        self._attr_name = display_name or card_name
         
-        # Build the entity name with filter info
-        name_parts = [card_name]
-        if card_set:
-            name_parts[0] = f"{card_name} ({card_set})"
-        
-        filters = []
+        self._attr_icon = "mdi:cards"
+        self._attr_device_info = _device_info(entry.entry_id)
+
+        # Attributes that do not change with the prices
+        self._static_attrs: dict[str, Any] = {
+            ATTR_CARD_NAME: card_name,
+            ATTR_CARD_SET: card_set,
+            ATTR_CARD_URL: card_url,
+        }
         if language:
-            filters.append(CARD_LANGUAGES.get(language, language))
+            self._static_attrs[ATTR_LANGUAGE] = CARD_LANGUAGES.get(language, language)
         if condition:
-            filters.append(CARD_CONDITIONS.get(condition, condition))
+            self._static_attrs[ATTR_CONDITION] = CARD_CONDITIONS.get(condition, condition)
         if foil:
-            filters.append(CARD_FOIL_OPTIONS.get(foil, foil))
-        
-        if filters:
-            self._attr_name = f"{name_parts[0]} [{', '.join(filters)}]"
-        else:
-            self._attr_name = name_parts[0]
-        
-        self._attr_icon = "mdi:cards"
+            self._static_attrs[ATTR_FOIL] = CARD_FOIL_OPTIONS.get(foil, foil)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._entry.entry_id}_cards")},
-            name="Cardmarket Card Tracking",
-            manufacturer="Cardmarket",
-            model="Price Tracker",
-            via_device=(DOMAIN, self._entry.entry_id),
-        )
+        # Price data of this card, refreshed once per coordinator update
+        self._card_data: dict[str, Any] | None = None
+        self._update_card_data()
+
+    def _update_card_data(self) -> None:
+        """Look up the price data of this card in the coordinator data."""
+        if not self.coordinator.data:
+            self._card_data = None
+            return
+        tracked_cards = self.coordinator.data.get(KEY_TRACKED_CARDS, {})
+        # Use unique_key to look up the card data
+        self._card_data = tracked_cards.get(self._unique_key, {})
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_card_data()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> float | None:
         """Return the card's current lowest price."""
-        if not self.coordinator.data:
+        if self._card_data is None:
             return None
         
-        tracked_cards = self.coordinator.data.get("tracked_cards", {})
-        # Use unique_key to look up the card data
-        card_data = tracked_cards.get(self._unique_key, {})
-        
-        return card_data.get("price_from")
+        return self._card_data.get("price_from")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
+        if (card_data := self._card_data) is None:
             return {}
         
-        tracked_cards = self.coordinator.data.get("tracked_cards", {})
-        card_data = tracked_cards.get(self._unique_key, {})
-        
-        attrs = {
-            ATTR_CARD_NAME: self._card_name,
-            ATTR_CARD_SET: self._card_set,
-            ATTR_CARD_URL: self._card_url,
-        }
-        
-        # Add filter info
-        if self._language:
-            attrs[ATTR_LANGUAGE] = CARD_LANGUAGES.get(self._language, self._language)
-        if self._condition:
-            attrs[ATTR_CONDITION] = CARD_CONDITIONS.get(self._condition, self._condition)
-        if self._foil:
-            attrs[ATTR_FOIL] = CARD_FOIL_OPTIONS.get(self._foil, self._foil)
+        attrs = self._static_attrs.copy()
         
-        if price_from := card_data.get("price_from"):
-            attrs[ATTR_PRICE_FROM] = price_from
-        if price_trend := card_data.get("price_trend"):
-            attrs[ATTR_PRICE_TREND] = price_trend
-        if price_30 := card_data.get("price_30_day_avg"):
-            attrs[ATTR_PRICE_30_DAY] = price_30
-        if price_7 := card_data.get("price_7_day_avg"):
-            attrs[ATTR_PRICE_7_DAY] = price_7
-        if price_1 := card_data.get("price_1_day_avg"):
-            attrs[ATTR_PRICE_1_DAY] = price_1
-        if available := card_data.get("available_items"):
-            attrs[ATTR_AVAILABLE_ITEMS] = available
+        for field, attr in _PRICE_FIELDS:
+            if value := card_data.get(field):
+                attrs[attr] = value
         
         # Add filter URL if available
         if filter_url := card_data.get("filter_url"):
@@ -164,13 +178,71 @@ class CardmarketCardPriceSensor(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if not self.coordinator.data:
+        if self._card_data is None:
             return False
         
-        tracked_cards = self.coordinator.data.get("tracked_cards", {})
-        card_data = tracked_cards.get(self._unique_key, {})
-        
-        return "error" not in card_data
+        return "error" not in self._card_data
+
+
+@lru_cache(maxsize=32)
+def _device_info(entry_id: str) -> DeviceInfo:
+    """Return the device info shared by the card sensors of an entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"{entry_id}_cards")},
+        name="Cardmarket Card Tracking",
+        manufacturer="Cardmarket",
+        model="Price Tracker",
+        via_device=(DOMAIN, entry_id),
+    )
+
+
+def _format_name(card: dict[str, Any]) -> tuple[str, str]:
+    """Return the display name and the sanitized ID of a tracked card."""
+    card_name = card.get("name", "Unknown Card")
+    card_set = card.get("set", "")
+    language = card.get("language", "")
+    condition = card.get("condition", "")
+    foil = card.get("foil", "")
+
+    display_name = f"{card_name} ({card_set})" if card_set else card_name
+    filters = ", ".join(
+        labels.get(value, value)
+        for labels, value in (
+            (CARD_LANGUAGES, language),
+            (CARD_CONDITIONS, condition),
+            (CARD_FOIL_OPTIONS, foil),
+        )
+        if value
+    )
+    if filters:
+        display_name = f"{display_name} [{filters}]"
+
+    unique_key = card.get("unique_key") or card.get("url", "")
+    return display_name, unique_key.translate(_SAFE_ID_TABLE)
+
+
+def _create_card_sensor(
+    coordinator: CardmarketDataUpdateCoordinator,
+    entry: ConfigEntry,
+    card: dict[str, Any],
+) -> CardmarketCardPriceSensor:
+    """Create the price sensor of a tracked card."""
+    card_url = card["url"]
+    display_name, safe_id = _format_name(card)
+    return CardmarketCardPriceSensor(
+        coordinator=coordinator,
+        card_url=card_url,
+        card_name=card.get("name", "Unknown Card"),
+        card_set=card.get("set", ""),
+        entry=entry,
+        language=card.get("language", ""),
+        condition=card.get("condition", ""),
+        foil=card.get("foil", ""),
+        # Interned so that the lookups in the coordinator data compare by identity
+        unique_key=sys.intern(card.get("unique_key") or card_url),
+        display_name=display_name,
+        safe_id=safe_id,
+    )
 
 
 async def async_setup_tracked_card_sensors(
@@ -185,31 +257,9 @@ async def async_setup_tracked_card_sensors(
     if not tracked_cards:
         return
     
-    entities = []
-    
-    for card in tracked_cards:
-        card_url = card.get("url", "")
-        card_name = card.get("name", "Unknown Card")
-        card_set = card.get("set", "")
-        language = card.get("language", "")
-        condition = card.get("condition", "")
-        foil = card.get("foil", "")
-        unique_key = card.get("unique_key", card_url)
-        
-        if card_url:
-            entities.append(
-                CardmarketCardPriceSensor(
-                    coordinator=coordinator,
-                    card_url=card_url,
-                    card_name=card_name,
-                    card_set=card_set,
-                    entry=entry,
-                    language=language,
-                    condition=condition,
-                    foil=foil,
-                    unique_key=unique_key,
-                )
-            )
-    
-    if entities:
-        async_add_entities(entities)
+    # Sensors are created while Home Assistant consumes the generator
+    async_add_entities(
+        _create_card_sensor(coordinator, entry, card)
+        for card in tracked_cards
+        if card.get("url")
+    )
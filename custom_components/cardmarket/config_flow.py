@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import sys
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -13,7 +15,12 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 
-from .api import CardmarketScraper, CardmarketAuthError, CardmarketConnectionError
+from .api import (
+    CardmarketAuthError,
+    CardmarketConnectionError,
+    CardmarketError,
+    CardmarketScraper,
+)
 from .const import (
     CARD_CONDITIONS,
     CARD_FOIL_OPTIONS,
@@ -48,6 +55,32 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+_INIT_MENU = ("search_card", "manage_tracked")
+
+SEARCH_CARD_SCHEMA = vol.Schema(
+    {
+        vol.Required("search_term"): str,
+    }
+)
+
+CARD_FILTERS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_CARD_LANGUAGE, default=""): vol.In(CARD_LANGUAGES),
+        vol.Optional(CONF_CARD_CONDITION, default=""): vol.In(CARD_CONDITIONS),
+        vol.Optional(CONF_CARD_FOIL, default=""): vol.In(CARD_FOIL_OPTIONS),
+    }
+)
+
+
+@lru_cache(maxsize=16)
+def _select_card_schema(card_options: tuple[tuple[str, str], ...]) -> vol.Schema:
+    """Return the card selection schema for the given search results."""
+    return vol.Schema(
+        {
+            vol.Required("card"): vol.In(dict(card_options)),
+        }
+    )
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
@@ -70,14 +103,37 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     finally:
         await scraper.close()
 
-    username = data[CONF_USERNAME]
-    game = data.get(CONF_GAME, DEFAULT_GAME)
+    title, unique_id = _title_and_uid(
+        data[CONF_USERNAME], data.get(CONF_GAME, DEFAULT_GAME)
+    )
+    return {"title": title, "unique_id": unique_id}
+
+
+@lru_cache(maxsize=128)
+def _title_and_uid(username: str, game: str) -> tuple[str, str]:
+    """Return the entry title and the unique ID of an account and game."""
     game_name = SUPPORTED_GAMES.get(game, game)
+    return (
+        f"Cardmarket {game_name} ({username})",
+        sys.intern(f"{username.lower()}_{game.lower()}"),
+    )
 
-    return {
-        "title": f"Cardmarket {game_name} ({username})",
-        "unique_id": f"{username.lower()}_{game.lower()}",
-    }
+
+def _tracked_card_label(card: dict[str, Any]) -> str:
+    """Return the label of a tracked card in the manage_tracked form."""
+    label = f"{card.get('name', 'Unknown')} ({card.get('set', 'Unknown')})"
+    filters = ", ".join(
+        labels.get(value, value)
+        for labels, value in (
+            (CARD_LANGUAGES, card.get("language")),
+            (CARD_CONDITIONS, card.get("condition")),
+            (CARD_FOIL_OPTIONS, card.get("foil")),
+        )
+        if value
+    )
+    if filters:
+        label = f"{label} [{filters}]"
+    return label
 
 
 class CardmarketConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -138,7 +194,10 @@ class CardmarketOptionsFlowHandler(config_entries.OptionsFlow):
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
+        self._entry_id = config_entry.entry_id
         self._search_results: list[dict[str, Any]] = []
+        self._search_results_by_url: dict[str, dict[str, Any]] = {}
+        self._search_card_options: tuple[tuple[str, str], ...] = ()
         self._selected_card: dict[str, Any] | None = None
 
     async def async_step_init(
@@ -147,7 +206,7 @@ class CardmarketOptionsFlowHandler(config_entries.OptionsFlow):
         """Manage the options."""
         return self.async_show_menu(
             step_id="init",
-            menu_options=["search_card", "manage_tracked"],
+            menu_options=_INIT_MENU,
         )
 
     async def async_step_search_card(
@@ -160,31 +219,36 @@ class CardmarketOptionsFlowHandler(config_entries.OptionsFlow):
             search_term = user_input.get("search_term", "")
             
             if search_term:
-                # Get API from hass.data
-                if DOMAIN in self.hass.data:
-                    for entry_id, data in self.hass.data[DOMAIN].items():
-                        if "api" in data:
-                            api = data["api"]
-                            try:
-                                self._search_results = await api.search_cards(
-                                    search_term, max_results=20
-                                )
-                                if self._search_results:
-                                    return await self.async_step_select_card()
-                                else:
-                                    errors["base"] = "no_results"
-                            except Exception as err:
-                                _LOGGER.error("Search failed: %s", err)
-                                errors["base"] = "search_failed"
-                            break
+                # Get the API of this entry from hass.data
+                entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry_id)
+                api = entry_data.get("api") if entry_data else None
+                if api is None:
+                    errors["base"] = "not_ready"
+                else:
+                    try:
+                        self._search_results = await api.search_cards(
+                            search_term, max_results=20
+                        )
+                        self._search_results_by_url = {
+                            card["url"]: card
+                            for card in self._search_results
+                            if card.get("url")
+                        }
+                        self._search_card_options = tuple(
+                            (url, f"{card.get('name')} ({card.get('set', 'Unknown')})")
+                            for url, card in self._search_results_by_url.items()
+                        )
+                        if self._search_results:
+                            return await self.async_step_select_card()
+                        else:
+                            errors["base"] = "no_results"
+                    except CardmarketError as err:
+                        _LOGGER.error("Search failed: %s", err)
+                        errors["base"] = "search_failed"
 
         return self.async_show_form(
             step_id="search_card",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("search_term"): str,
-                }
-            ),
+            data_schema=SEARCH_CARD_SCHEMA,
             errors=errors,
         )
 
@@ -195,28 +259,15 @@ class CardmarketOptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             selected_url = user_input.get("card")
             
-            if selected_url:
-                # Find the card info and store it for the filter step
-                for card in self._search_results:
-                    if card.get("url") == selected_url:
-                        self._selected_card = card
-                        # Go to filter step instead of adding directly
-                        return await self.async_step_card_filters()
+            # Find the card info and store it for the filter step
+            if card := self._search_results_by_url.get(selected_url):
+                self._selected_card = card
+                # Go to filter step instead of adding directly
+                return await self.async_step_card_filters()
         
-        # Build options from search results
-        card_options = {
-            card.get("url"): f"{card.get('name')} ({card.get('set', 'Unknown')})"
-            for card in self._search_results
-            if card.get("url")
-        }
-
         return self.async_show_form(
             step_id="select_card",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("card"): vol.In(card_options),
-                }
-            ),
+            data_schema=_select_card_schema(self._search_card_options),
         )
 
     async def async_step_card_filters(
@@ -233,18 +284,21 @@ class CardmarketOptionsFlowHandler(config_entries.OptionsFlow):
             foil = user_input.get(CONF_CARD_FOIL, "")
 
             # Add to tracked cards with filters
-            current_tracked = list(
-                self.config_entry.options.get(CONF_TRACKED_CARDS, [])
-            )
+            current_tracked = self.config_entry.options.get(CONF_TRACKED_CARDS, [])
+            existing_keys = {
+                c.get("unique_key") or c.get("url") for c in current_tracked
+            }
 
             # Create unique key for this card+filter combination
             card_key = self._selected_card.get("url")
             if language or condition or foil:
-                card_key = f"{card_key}?lang={language}&cond={condition}&foil={foil}"
+                card_key = sys.intern(
+                    f"{card_key}?lang={language}&cond={condition}&foil={foil}"
+                )
 
             # Check if already tracked with same filters
-            if not any(c.get("url") == card_key for c in current_tracked):
-                current_tracked.append({
+            if card_key not in existing_keys:
+                new_card = {
                     "url": self._selected_card.get("url"),
                     "name": self._selected_card.get("name"),
                     "set": self._selected_card.get("set", ""),
@@ -252,25 +306,19 @@ class CardmarketOptionsFlowHandler(config_entries.OptionsFlow):
                     "condition": condition,
                     "foil": foil,
                     "unique_key": card_key,
-                })
+                }
 
                 self._selected_card = None
                 return self.async_create_entry(
                     title="",
-                    data={CONF_TRACKED_CARDS: current_tracked},
+                    data={CONF_TRACKED_CARDS: [*current_tracked, new_card]},
                 )
             else:
                 return self.async_abort(reason="already_tracked")
 
         return self.async_show_form(
             step_id="card_filters",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(CONF_CARD_LANGUAGE, default=""): vol.In(CARD_LANGUAGES),
-                    vol.Optional(CONF_CARD_CONDITION, default=""): vol.In(CARD_CONDITIONS),
-                    vol.Optional(CONF_CARD_FOIL, default=""): vol.In(CARD_FOIL_OPTIONS),
-                }
-            ),
+            data_schema=CARD_FILTERS_SCHEMA,
             description_placeholders={
                 "card_name": self._selected_card.get("name", "Unknown"),
             },
@@ -280,12 +328,10 @@ class CardmarketOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle managing tracked cards."""
-        current_tracked = list(
-            self.config_entry.options.get(CONF_TRACKED_CARDS, [])
-        )
+        current_tracked = self.config_entry.options.get(CONF_TRACKED_CARDS, [])
 
         if user_input is not None:
-            cards_to_keep = user_input.get("tracked_cards", [])
+            cards_to_keep = frozenset(user_input.get("tracked_cards", ()))
             
             # Filter to only keep selected cards (use unique_key if available)
             new_tracked = [
@@ -302,28 +348,15 @@ class CardmarketOptionsFlowHandler(config_entries.OptionsFlow):
             return self.async_abort(reason="no_tracked_cards")
 
         # Build multi-select options with filter info
-        card_options = {}
-        for card in current_tracked:
-            if not card.get("url"):
-                continue
-            key = card.get("unique_key", card.get("url"))
-            name = card.get("name", "Unknown")
-            card_set = card.get("set", "Unknown")
-            
-            # Build filter suffix
-            filters = []
-            if lang := card.get("language"):
-                filters.append(CARD_LANGUAGES.get(lang, lang))
-            if cond := card.get("condition"):
-                filters.append(CARD_CONDITIONS.get(cond, cond))
-            if foil := card.get("foil"):
-                filters.append(CARD_FOIL_OPTIONS.get(foil, foil))
-            
-            filter_str = f" [{', '.join(filters)}]" if filters else ""
-            card_options[key] = f"{name} ({card_set}){filter_str}"
+        card_options = {
+            card.get("unique_key", card["url"]): _tracked_card_label(card)
+            for card in current_tracked
+            if card.get("url")
+        }
         
-        # Default to all currently tracked
-        default_selected = list(card_options.keys())
+        # Default to all currently tracked, the default is sent to the frontend
+        # as JSON so it has to be a list rather than a keys view
+        default_selected = list(card_options)
 
         return self.async_show_form(
             step_id="manage_tracked",
@@ -40,11 +40,51 @@ PURCHASES_URL_TEMPLATE = "https://www.cardmarket.com/en/{game}/Orders/Purchases"
 MESSAGES_URL_TEMPLATE = "https://www.cardmarket.com/en/{game}/Account/Messages"
 GAME_URL_TEMPLATE = "https://www.cardmarket.com/en/{game}"
 
+URL_TEMPLATES = {
+    "login": LOGIN_URL_TEMPLATE,
+    "search": SEARCH_URL_TEMPLATE,
+    "stock": STOCK_URL_TEMPLATE,
+    "sales": SALES_URL_TEMPLATE,
+    "purchases": PURCHASES_URL_TEMPLATE,
+    "messages": MESSAGES_URL_TEMPLATE,
+    "game": GAME_URL_TEMPLATE,
+}
+
 # Update intervals (in seconds)
 DEFAULT_SCAN_INTERVAL = 3600  # 60 minutes
 MIN_SCAN_INTERVAL = 300  # 5 minutes minimum
 MAX_SCAN_INTERVAL = 86400  # 24 hours maximum
 
+# Storage for the cookies of the logged-in session
+STORAGE_VERSION = 1
+STORAGE_KEY_SESSION = "cardmarket.{entry_id}.session"
+
+# Number of worker threads used for concurrent page requests
+DEFAULT_MAX_WORKERS = 8
+
+# Maximum number of concurrent requests, to stay below Cardmarket's rate limits
+MAX_CONCURRENT_REQUESTS = 5
+
+# Seconds to wait for more add_tracked_card calls before updating the options
+ADD_CARD_BATCH_DELAY = 0.2
+
+# Card searches are answered from memory for this many seconds
+SEARCH_CACHE_TTL = 60.0
+SEARCH_CACHE_SIZE = 128
+
+# Keys of the coordinator data, shared by the scraper and the sensors
+KEY_ACCOUNT = "account"
+KEY_STOCK_COUNT = "stock_count"
+KEY_STOCK_VALUE = "stock_value"
+KEY_SELLER_ORDERS_PAID = "seller_orders_paid"
+KEY_SELLER_ORDERS_SENT = "seller_orders_sent"
+KEY_SELLER_ORDERS_ARRIVED = "seller_orders_arrived"
+KEY_BUYER_ORDERS_PAID = "buyer_orders_paid"
+KEY_BUYER_ORDERS_SENT = "buyer_orders_sent"
+KEY_BUYER_ORDERS_ARRIVED = "buyer_orders_arrived"
+KEY_UNREAD_MESSAGES = "unread_messages"
+KEY_TRACKED_CARDS = "tracked_cards"
+
 # Sensor types
 SENSOR_ACCOUNT_BALANCE = "account_balance"
 SENSOR_STOCK_COUNT = "stock_count"
@@ -121,3 +161,6 @@ ATTR_FOIL = "foil"
 SERVICE_SEARCH_CARD = "search_card"
 SERVICE_ADD_TRACKED_CARD = "add_tracked_card"
 SERVICE_REMOVE_TRACKED_CARD = "remove_tracked_card"
+
+# Events
+EVENT_SEARCH_RESULTS = f"{DOMAIN}_search_results"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
 from typing import Any
@@ -10,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import CardmarketScraper, CardmarketError
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, KEY_TRACKED_CARDS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,14 +24,19 @@ class CardmarketDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         scraper: CardmarketScraper,
         tracked_cards: list[dict[str, Any]] | None = None,
-        scan_interval: int = DEFAULT_SCAN_INTERVAL,
+        scan_interval: int | timedelta = DEFAULT_SCAN_INTERVAL,
     ) -> None:
-        """Initialize the coordinator."""
+        """Initialize the coordinator.
+
+        The scan interval is either a timedelta or a number of seconds.
+        """
+        if not isinstance(scan_interval, timedelta):
+            scan_interval = timedelta(seconds=scan_interval)
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=scan_interval,
         )
         self.scraper = scraper
         self.tracked_cards = tracked_cards or []
@@ -40,21 +46,30 @@ class CardmarketDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.tracked_cards = cards
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from Cardmarket website."""
+        """Fetch data from Cardmarket website.
+
+        The scraper fetches the tracked card pages concurrently, bounded by
+        its request semaphore, and returns the prices keyed by the unique key
+        of each tracked card. Cards that failed carry an "error" entry instead
+        of failing the whole update.
+        """
         try:
-            # Get all account/order data
-            data = await self.scraper.get_all_data()
-            
-            # Get tracked card prices if any cards are being tracked
-            if self.tracked_cards:
-                tracked_cards = await self.scraper.get_tracked_card_prices(
-                    self.tracked_cards
-                )
-                data["tracked_cards"] = tracked_cards
-            else:
-                data["tracked_cards"] = {}
+            # The account pages and the tracked card pages are independent,
+            # so fetch them concurrently
+            data, tracked_cards = await asyncio.gather(
+                self.scraper.get_all_data(),
+                self.scraper.get_tracked_card_prices(self.tracked_cards)
+                if self.tracked_cards
+                else _no_tracked_cards(),
+            )
+            data[KEY_TRACKED_CARDS] = tracked_cards
             
             return data
 
         except CardmarketError as err:
             raise UpdateFailed(f"Error fetching data from Cardmarket: {err}") from err
+
+
+async def _no_tracked_cards() -> dict[str, dict[str, Any]]:
+    """Return the prices of no tracked cards."""
+    return {}
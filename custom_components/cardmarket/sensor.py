@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -18,6 +19,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .card_sensor import async_setup_tracked_card_sensors
 from .const import (
     ATTR_REPUTATION,
     ATTR_SELL_COUNT,
@@ -25,11 +27,21 @@ from .const import (
     ATTR_USERNAME,
     ATTR_VACATION_STATUS,
     DOMAIN,
+    KEY_ACCOUNT,
+    KEY_BUYER_ORDERS_ARRIVED,
+    KEY_BUYER_ORDERS_PAID,
+    KEY_BUYER_ORDERS_SENT,
+    KEY_SELLER_ORDERS_ARRIVED,
+    KEY_SELLER_ORDERS_PAID,
+    KEY_SELLER_ORDERS_SENT,
+    KEY_STOCK_COUNT,
+    KEY_STOCK_VALUE,
+    KEY_UNREAD_MESSAGES,
 )
 from .coordinator import CardmarketDataUpdateCoordinator
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CardmarketSensorEntityDescriptionMixin:
     """Mixin for Cardmarket sensor entity description."""
 
@@ -44,27 +56,74 @@ class CardmarketSensorEntityDescription(
     """Describe Cardmarket sensor entity."""
 
 
+# Fields of the account data exposed as attributes, empty values are skipped
+_ACCOUNT_ATTRIBUTES = (
+    ("username", ATTR_USERNAME),
+    ("reputation", ATTR_REPUTATION),
+    ("sell_count", ATTR_SELL_COUNT),
+    ("sold_items", ATTR_SOLD_ITEMS),
+)
+
+
 def get_account_balance(data: dict[str, Any]) -> float | None:
     """Get account balance from data."""
-    account = data.get("account", {})
+    account = data.get(KEY_ACCOUNT, {})
     return account.get("balance", 0.0)
 
 
 def get_account_attributes(data: dict[str, Any]) -> dict[str, Any]:
     """Get account attributes."""
-    account = data.get("account", {})
-    attrs = {}
-    
-    if username := account.get("username"):
-        attrs[ATTR_USERNAME] = username
-    if reputation := account.get("reputation"):
-        attrs[ATTR_REPUTATION] = reputation
-    if sell_count := account.get("sell_count"):
-        attrs[ATTR_SELL_COUNT] = sell_count
-    if sold_items := account.get("sold_items"):
-        attrs[ATTR_SOLD_ITEMS] = sold_items
+    account = data.get(KEY_ACCOUNT, {})
+    return {
+        attr: value
+        for field, attr in _ACCOUNT_ATTRIBUTES
+        if (value := account.get(field))
+    }
+
+
+def get_stock_count(data: dict[str, Any]) -> int:
+    """Get the number of articles in stock from data."""
+    return data.get(KEY_STOCK_COUNT, 0)
+
+
+def get_stock_value(data: dict[str, Any]) -> float:
+    """Get the total stock value from data."""
+    return round(data.get(KEY_STOCK_VALUE, 0.0), 2)
+
+
+def get_seller_orders_paid(data: dict[str, Any]) -> int:
+    """Get the number of paid seller orders from data."""
+    return data.get(KEY_SELLER_ORDERS_PAID, 0)
+
+
+def get_seller_orders_sent(data: dict[str, Any]) -> int:
+    """Get the number of sent seller orders from data."""
+    return data.get(KEY_SELLER_ORDERS_SENT, 0)
+
 
-    return attrs
+def get_seller_orders_arrived(data: dict[str, Any]) -> int:
+    """Get the number of arrived seller orders from data."""
+    return data.get(KEY_SELLER_ORDERS_ARRIVED, 0)
+
+
+def get_buyer_orders_paid(data: dict[str, Any]) -> int:
+    """Get the number of paid buyer orders from data."""
+    return data.get(KEY_BUYER_ORDERS_PAID, 0)
+
+
+def get_buyer_orders_sent(data: dict[str, Any]) -> int:
+    """Get the number of sent buyer orders from data."""
+    return data.get(KEY_BUYER_ORDERS_SENT, 0)
+
+
+def get_buyer_orders_arrived(data: dict[str, Any]) -> int:
+    """Get the number of arrived buyer orders from data."""
+    return data.get(KEY_BUYER_ORDERS_ARRIVED, 0)
+
+
+def get_unread_messages(data: dict[str, Any]) -> int:
+    """Get the number of unread messages from data."""
+    return data.get(KEY_UNREAD_MESSAGES, 0)
 
 
 SENSOR_DESCRIPTIONS: tuple[CardmarketSensorEntityDescription, ...] = (
@@ -83,7 +142,7 @@ SENSOR_DESCRIPTIONS: tuple[CardmarketSensorEntityDescription, ...] = (
         native_unit_of_measurement="articles",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:cards",
-        value_fn=lambda data: data.get("stock_count", 0),
+        value_fn=get_stock_count,
         attributes_fn=None,
     ),
     CardmarketSensorEntityDescription(
@@ -92,7 +151,7 @@ SENSOR_DESCRIPTIONS: tuple[CardmarketSensorEntityDescription, ...] = (
         native_unit_of_measurement="€",
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda data: round(data.get("stock_value", 0.0), 2),
+        value_fn=get_stock_value,
         attributes_fn=None,
     ),
     CardmarketSensorEntityDescription(
@@ -101,7 +160,7 @@ SENSOR_DESCRIPTIONS: tuple[CardmarketSensorEntityDescription, ...] = (
         native_unit_of_measurement="orders",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:package-variant",
-        value_fn=lambda data: data.get("seller_orders_paid", 0),
+        value_fn=get_seller_orders_paid,
         attributes_fn=None,
     ),
     CardmarketSensorEntityDescription(
@@ -110,7 +169,7 @@ SENSOR_DESCRIPTIONS: tuple[CardmarketSensorEntityDescription, ...] = (
         native_unit_of_measurement="orders",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:package-variant-closed",
-        value_fn=lambda data: data.get("seller_orders_sent", 0),
+        value_fn=get_seller_orders_sent,
         attributes_fn=None,
     ),
     CardmarketSensorEntityDescription(
@@ -119,7 +178,7 @@ SENSOR_DESCRIPTIONS: tuple[CardmarketSensorEntityDescription, ...] = (
         native_unit_of_measurement="orders",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:package-check",
-        value_fn=lambda data: data.get("seller_orders_arrived", 0),
+        value_fn=get_seller_orders_arrived,
         attributes_fn=None,
     ),
     CardmarketSensorEntityDescription(
@@ -128,7 +187,7 @@ SENSOR_DESCRIPTIONS: tuple[CardmarketSensorEntityDescription, ...] = (
         native_unit_of_measurement="orders",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:cart",
-        value_fn=lambda data: data.get("buyer_orders_paid", 0),
+        value_fn=get_buyer_orders_paid,
         attributes_fn=None,
     ),
     CardmarketSensorEntityDescription(
@@ -137,7 +196,7 @@ SENSOR_DESCRIPTIONS: tuple[CardmarketSensorEntityDescription, ...] = (
         native_unit_of_measurement="orders",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:truck-delivery",
-        value_fn=lambda data: data.get("buyer_orders_sent", 0),
+        value_fn=get_buyer_orders_sent,
         attributes_fn=None,
     ),
     CardmarketSensorEntityDescription(
@@ -146,7 +205,7 @@ SENSOR_DESCRIPTIONS: tuple[CardmarketSensorEntityDescription, ...] = (
         native_unit_of_measurement="orders",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:package-check",
-        value_fn=lambda data: data.get("buyer_orders_arrived", 0),
+        value_fn=get_buyer_orders_arrived,
         attributes_fn=None,
     ),
     CardmarketSensorEntityDescription(
@@ -155,12 +214,24 @@ SENSOR_DESCRIPTIONS: tuple[CardmarketSensorEntityDescription, ...] = (
         native_unit_of_measurement="messages",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:message-badge",
-        value_fn=lambda data: data.get("unread_messages", 0),
+        value_fn=get_unread_messages,
         attributes_fn=None,
     ),
 )
 
 
+@lru_cache(maxsize=32)
+def _device_info(entry_id: str, username: str) -> DeviceInfo:
+    """Return the device info shared by the sensors of an entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry_id)},
+        name=f"Cardmarket {username}",
+        manufacturer="Cardmarket",
+        model="Web Scraper",
+        entry_type=None,
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -171,14 +242,17 @@ async def async_setup_entry(
         "coordinator"
     ]
 
+    # Get username from coordinator data if available
+    account = coordinator.data.get(KEY_ACCOUNT, {}) if coordinator.data else {}
+    username = account.get("username", "Cardmarket")
+
     # Add standard sensors
     async_add_entities(
-        CardmarketSensor(coordinator, entry, description)
+        CardmarketSensor(coordinator, entry, description, username)
         for description in SENSOR_DESCRIPTIONS
     )
 
     # Add tracked card sensors
-    from .card_sensor import async_setup_tracked_card_sensors
     await async_setup_tracked_card_sensors(hass, entry, async_add_entities, coordinator)
 
 
@@ -195,36 +269,29 @@ class CardmarketSensor(
         coordinator: CardmarketDataUpdateCoordinator,
         entry: ConfigEntry,
         description: CardmarketSensorEntityDescription,
+        username: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._value_fn = description.value_fn
+        self._attributes_fn = description.attributes_fn
 
-        # Get username from coordinator data if available
-        account = coordinator.data.get("account", {}) if coordinator.data else {}
-        username = account.get("username", "Cardmarket")
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"Cardmarket {username}",
-            manufacturer="Cardmarket",
-            model="Web Scraper",
-            entry_type=None,
-        )
+        self._attr_device_info = _device_info(entry.entry_id, username)
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
         if self.coordinator.data is None:
             return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self._value_fn(self.coordinator.data)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
         if self.coordinator.data is None:
             return None
-        if self.entity_description.attributes_fn is None:
+        if self._attributes_fn is None:
             return None
-        return self.entity_description.attributes_fn(self.coordinator.data)
+        return self._attributes_fn(self.coordinator.data)
@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from datetime import datetime
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    ServiceCall,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    ADD_CARD_BATCH_DELAY,
     CONF_TRACKED_CARDS,
     DOMAIN,
+    EVENT_SEARCH_RESULTS,
+    SEARCH_CACHE_SIZE,
+    SEARCH_CACHE_TTL,
     SERVICE_ADD_TRACKED_CARD,
     SERVICE_REMOVE_TRACKED_CARD,
     SERVICE_SEARCH_CARD,
@@ -20,12 +36,27 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_SERVICES = (SERVICE_SEARCH_CARD, SERVICE_ADD_TRACKED_CARD, SERVICE_REMOVE_TRACKED_CARD)
+
+# Key of the callback adding the pending cards when the services are unloaded
+_DATA_FLUSH_ADDS = f"{DOMAIN}_flush_adds"
+
+
+def _max_results(value: Any) -> int:
+    """Validate the maximum number of search results."""
+    try:
+        value = int(value)
+    except (TypeError, ValueError) as err:
+        raise vol.Invalid("expected an integer") from err
+    if not 1 <= value <= 50:
+        raise vol.Invalid("value must be between 1 and 50")
+    return value
+
+
 SEARCH_CARD_SCHEMA = vol.Schema(
     {
         vol.Required("search_term"): cv.string,
-        vol.Optional("max_results", default=10): vol.All(
-            vol.Coerce(int), vol.Range(min=1, max=50)
-        ),
+        vol.Optional("max_results", default=10): _max_results,
     }
 )
 
@@ -46,6 +77,34 @@ REMOVE_TRACKED_CARD_SCHEMA = vol.Schema(
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Cardmarket integration."""
+    # Looked up once, the domain data dict is never replaced while loaded
+    domain_data: dict[str, dict[str, Any]] = hass.data[DOMAIN]
+    async_get_entry = hass.config_entries.async_get_entry
+    async_update_entry = hass.config_entries.async_update_entry
+    async_fire = hass.bus.async_fire
+
+    # The entry the services act on, resolved again once it is unloaded
+    first_entry: tuple[str, dict[str, Any], ConfigEntry] | None = None
+
+    def _first_entry() -> tuple[str, dict[str, Any], ConfigEntry] | None:
+        """Return the ID, data and config entry of the first loaded entry."""
+        nonlocal first_entry
+        if first_entry is not None and domain_data.get(first_entry[0]) is first_entry[1]:
+            return first_entry
+
+        first_entry = None
+        if not domain_data:
+            return None
+        entry_id = next(iter(domain_data))
+        data = domain_data[entry_id]
+        if entry := data.get("entry") or async_get_entry(entry_id):
+            first_entry = (entry_id, data, entry)
+        return first_entry
+
+    # Recent search results by entry, search term and maximum result count
+    search_cache: OrderedDict[
+        tuple[str, str, int], tuple[float, list[dict[str, Any]]]
+    ] = OrderedDict()
 
     async def handle_search_card(call: ServiceCall) -> dict[str, Any]:
         """Handle the search_card service call."""
@@ -53,126 +112,205 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         max_results = call.data.get("max_results", 10)
         
         # Get the first configured entry's API
-        for entry_id, data in hass.data.get(DOMAIN, {}).items():
-            if "api" in data:
-                api = data["api"]
-                results = await api.search_cards(search_term, max_results)
-                
-                # Fire an event with the search results
-                hass.bus.async_fire(
-                    f"{DOMAIN}_search_results",
-                    {
-                        "search_term": search_term,
-                        "results": results,
-                    }
+        if (resolved := _first_entry()) is None or "api" not in resolved[1]:
+            _LOGGER.error("No Cardmarket API available for search")
+            return {"results": [], "error": "No API available"}
+
+        # Reuse recent results of the same search
+        key = (resolved[0], search_term.strip().lower(), max_results)
+        now = time.monotonic()
+        cached = search_cache.get(key)
+        if cached is not None and now - cached[0] < SEARCH_CACHE_TTL:
+            search_cache.move_to_end(key)
+            results = cached[1]
+        else:
+            api = resolved[1]["api"]
+            results = await api.search_cards(search_term, max_results)
+            search_cache[key] = (now, results)
+            search_cache.move_to_end(key)
+            if len(search_cache) > SEARCH_CACHE_SIZE:
+                search_cache.popitem(last=False)
+        
+        # Callers asking for a response get the results directly, the others
+        # get an event with the search results
+        if not call.return_response:
+            async_fire(
+                EVENT_SEARCH_RESULTS,
+                {
+                    "search_term": search_term,
+                    "results": results,
+                }
+            )
+        
+        _LOGGER.info(
+            "Card search for '%s' returned %d results",
+            search_term,
+            len(results),
+        )
+        
+        return {"results": results}
+
+    # Cards added within the batching window, per entry and keyed by URL
+    pending_adds: dict[str, dict[str, dict[str, Any]]] = {}
+    cancel_flush: CALLBACK_TYPE | None = None
+
+    @callback
+    def _flush_adds(_now: datetime) -> None:
+        """Add the pending cards with one options update per entry."""
+        nonlocal cancel_flush
+        cancel_flush = None
+        batches = pending_adds.copy()
+        pending_adds.clear()
+
+        for entry_id, cards in batches.items():
+            # An entry being unloaded has no data anymore, its options are
+            # still updated so the cards are tracked once it is loaded again
+            data = domain_data.get(entry_id)
+            entry = data.get("entry") if data else async_get_entry(entry_id)
+            if entry is None:
+                _LOGGER.warning(
+                    "Cardmarket entry was removed, cards not added: %s",
+                    ", ".join(card["name"] for card in cards.values()),
                 )
-                
-                _LOGGER.info(
-                    "Card search for '%s' returned %d results",
-                    search_term,
-                    len(results),
+                continue
+
+            # Get current tracked cards from options
+            tracked_cards = entry.options.get(CONF_TRACKED_CARDS, ())
+            tracked_urls = {card.get("url") for card in tracked_cards}
+            
+            # Skip cards that are already tracked
+            new_cards = []
+            for card_url, card in cards.items():
+                if card_url in tracked_urls:
+                    _LOGGER.info("Card %s is already being tracked", card["name"])
+                else:
+                    new_cards.append(card)
+            if not new_cards:
+                continue
+            
+            # Update options
+            async_update_entry(
+                entry,
+                options={
+                    **entry.options,
+                    CONF_TRACKED_CARDS: [*tracked_cards, *new_cards],
+                },
+            )
+            
+            for card in new_cards:
+                _LOGGER.info("Added card to tracking: %s (%s)", card["name"], card["set"])
+            
+            # Trigger a coordinator refresh, cancelled if the entry is unloaded
+            if data and "coordinator" in data:
+                entry.async_create_background_task(
+                    hass,
+                    data["coordinator"].async_request_refresh(),
+                    f"{DOMAIN}_refresh_after_add",
                 )
-                
-                return {"results": results}
-        
-        _LOGGER.error("No Cardmarket API available for search")
-        return {"results": [], "error": "No API available"}
 
-    async def handle_add_tracked_card(call: ServiceCall) -> None:
-        """Handle the add_tracked_card service call."""
+    @callback
+    def handle_add_tracked_card(call: ServiceCall) -> None:
+        """Handle the add_tracked_card service call.
+
+        Every options update reloads the entry, so cards added in quick
+        succession are collected and added together after a short delay.
+        """
+        nonlocal cancel_flush
         card_url = call.data["card_url"]
-        card_name = call.data["card_name"]
-        card_set = call.data.get("card_set", "")
         
         # Get the first configured entry
-        for entry_id, data in hass.data.get(DOMAIN, {}).items():
-            entry = hass.config_entries.async_get_entry(entry_id)
-            if entry:
-                # Get current tracked cards from options
-                current_options = dict(entry.options)
-                tracked_cards = list(current_options.get(CONF_TRACKED_CARDS, []))
-                
-                # Check if card is already tracked
-                for card in tracked_cards:
-                    if card.get("url") == card_url:
-                        _LOGGER.info("Card %s is already being tracked", card_name)
-                        return
-                
-                # Add the new card
-                tracked_cards.append({
-                    "url": card_url,
-                    "name": card_name,
-                    "set": card_set,
-                })
-                
-                # Update options
-                current_options[CONF_TRACKED_CARDS] = tracked_cards
-                hass.config_entries.async_update_entry(entry, options=current_options)
-                
-                _LOGGER.info("Added card to tracking: %s (%s)", card_name, card_set)
-                
-                # Trigger a coordinator refresh
-                if "coordinator" in data:
-                    await data["coordinator"].async_request_refresh()
-                
-                return
-        
-        _LOGGER.error("No Cardmarket entry found to add tracked card")
+        if (resolved := _first_entry()) is None:
+            _LOGGER.error("No Cardmarket entry found to add tracked card")
+            return
+        entry_id = resolved[0]
 
-    async def handle_remove_tracked_card(call: ServiceCall) -> None:
+        # Later calls for the same URL within the window replace earlier ones
+        pending_adds.setdefault(entry_id, {})[card_url] = {
+            "url": card_url,
+            "name": call.data["card_name"],
+            "set": call.data.get("card_set", ""),
+        }
+        if cancel_flush is None:
+            cancel_flush = async_call_later(hass, ADD_CARD_BATCH_DELAY, _flush_adds)
+
+    @callback
+    def handle_remove_tracked_card(call: ServiceCall) -> None:
         """Handle the remove_tracked_card service call."""
         card_url = call.data["card_url"]
         
         # Get the first configured entry
-        for entry_id, data in hass.data.get(DOMAIN, {}).items():
-            entry = hass.config_entries.async_get_entry(entry_id)
-            if entry:
-                # Get current tracked cards from options
-                current_options = dict(entry.options)
-                tracked_cards = list(current_options.get(CONF_TRACKED_CARDS, []))
-                
-                # Find and remove the card
-                original_count = len(tracked_cards)
-                tracked_cards = [c for c in tracked_cards if c.get("url") != card_url]
-                
-                if len(tracked_cards) < original_count:
-                    # Update options
-                    current_options[CONF_TRACKED_CARDS] = tracked_cards
-                    hass.config_entries.async_update_entry(entry, options=current_options)
-                    
-                    _LOGGER.info("Removed card from tracking: %s", card_url)
-                else:
-                    _LOGGER.warning("Card not found in tracked cards: %s", card_url)
-                
-                return
+        if (resolved := _first_entry()) is None:
+            _LOGGER.error("No Cardmarket entry found to remove tracked card")
+            return
+        entry_id, _, entry = resolved
+
+        # Drop the card if it is still waiting to be added
+        queued = pending_adds.get(entry_id, {}).pop(card_url, None) is not None
+
+        # The options are only read here, a new list is built if the card is found
+        tracked_cards = entry.options.get(CONF_TRACKED_CARDS, ())
+        if not any(card.get("url") == card_url for card in tracked_cards):
+            if queued:
+                _LOGGER.info("Removed card from tracking: %s", card_url)
+            else:
+                _LOGGER.warning("Card not found in tracked cards: %s", card_url)
+            return
+
+        # Update options
+        async_update_entry(
+            entry,
+            options={
+                **entry.options,
+                CONF_TRACKED_CARDS: [
+                    card for card in tracked_cards if card.get("url") != card_url
+                ],
+            },
+        )
         
-        _LOGGER.error("No Cardmarket entry found to remove tracked card")
+        _LOGGER.info("Removed card from tracking: %s", card_url)
+
+    @callback
+    def _flush_pending_adds() -> None:
+        """Cancel the batching window and add the pending cards right away."""
+        if cancel_flush is not None:
+            cancel_flush()
+            _flush_adds(dt_util.utcnow())
+
+    hass.data[_DATA_FLUSH_ADDS] = _flush_pending_adds
 
     # Register services
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SEARCH_CARD,
-        handle_search_card,
-        schema=SEARCH_CARD_SCHEMA,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ADD_TRACKED_CARD,
-        handle_add_tracked_card,
-        schema=ADD_TRACKED_CARD_SCHEMA,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_REMOVE_TRACKED_CARD,
-        handle_remove_tracked_card,
-        schema=REMOVE_TRACKED_CARD_SCHEMA,
-    )
+    for service, handler, schema, supports_response in (
+        (
+            SERVICE_SEARCH_CARD,
+            handle_search_card,
+            SEARCH_CARD_SCHEMA,
+            SupportsResponse.OPTIONAL,
+        ),
+        (
+            SERVICE_ADD_TRACKED_CARD,
+            handle_add_tracked_card,
+            ADD_TRACKED_CARD_SCHEMA,
+            SupportsResponse.NONE,
+        ),
+        (
+            SERVICE_REMOVE_TRACKED_CARD,
+            handle_remove_tracked_card,
+            REMOVE_TRACKED_CARD_SCHEMA,
+            SupportsResponse.NONE,
+        ),
+    ):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handler,
+            schema=schema,
+            supports_response=supports_response,
+        )
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload Cardmarket services."""
-    hass.services.async_remove(DOMAIN, SERVICE_SEARCH_CARD)
-    hass.services.async_remove(DOMAIN, SERVICE_ADD_TRACKED_CARD)
-    hass.services.async_remove(DOMAIN, SERVICE_REMOVE_TRACKED_CARD)
+    if (flush_pending_adds := hass.data.pop(_DATA_FLUSH_ADDS, None)) is not None:
+        flush_pending_adds()
+    for service in _SERVICES:
+        hass.services.async_remove(DOMAIN, service)